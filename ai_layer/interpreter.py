@@ -3,34 +3,66 @@
 # Run: py -m ai_layer.interpreter --date 2025-08-14
 
 from __future__ import annotations
-import argparse, json, os, math, time
+import argparse, heapq, io, json, os, time
 from collections import Counter
 
+# Optional dep (graceful if missing): fast JSONL parse/serialize
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+_loads = orjson.loads if orjson else json.loads
+_CHUNK = 1 << 20
+
+_MKDIR_CACHE: set[str] = set()
+
+def _ensure_dir(d: str):
+    """os.makedirs once per directory per process (skips the stat syscall)."""
+    if d and d not in _MKDIR_CACHE:
+        os.makedirs(d, exist_ok=True)
+        _MKDIR_CACHE.add(d)
+
 def load_jsonl(path):
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            line=line.strip()
-            if line:
-                try: yield json.loads(line)
-                except: continue
+    # Chunked binary read + split on b"\n"; no readline/strip per row.
+    with open(path, "rb") as f:
+        tail = b""
+        while True:
+            chunk = f.read(_CHUNK)
+            if not chunk:
+                break
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                if line:
+                    try: yield _loads(line)
+                    except: continue
+        if tail:
+            try: yield _loads(tail)
+            except: pass
 
 def save_jsonl(path, rows):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    _ensure_dir(os.path.dirname(path))
+    if orjson is not None:
+        buf = b"".join(orjson.dumps(r, option=orjson.OPT_APPEND_NEWLINE) for r in rows)
+    else:
+        buf = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(buf)
+
+_INV_HALF_LIFE = 1.0 / 120.0  # 2h half-life style weight
 
 def freshness_w(minutes:int) -> float:
-    # 2h half-life style weight
-    return 1.0 / (1.0 + (minutes or 0)/120.0)
+    return 1.0 / (1.0 + (minutes or 0) * _INV_HALF_LIFE)
 
 def compute_score(bundle:dict, ai:dict) -> float:
+    # fields come from our own JSON output, so no defensive casts needed
     rf = bundle.get("rule_features", {})
-    fresh_min = int(rf.get("freshness_min", 0))
+    fresh_min = rf.get("freshness_min", 0)
     vol = 1 if rf.get("vol_flags") else 0
-    agency_inst = float(ai.get("agency", {}).get("institutional", 0.5))
-    certainty = float(ai.get("certainty", ai.get("confidence", 0.5)))
-    sent = abs(float(ai.get("sentiment", 0.0)))
+    agency_inst = ai.get("agency", {}).get("institutional", 0.5)
+    certainty = ai.get("certainty", ai.get("confidence", 0.5))
+    sent = abs(ai.get("sentiment", 0.0))
 
     # Components → 0..100
     score = (
@@ -48,15 +80,34 @@ def merge(date:str, in_bundles:str|None=None, in_ai:str|None=None, out_path:str|
     out_path   = out_path or f"data/ai_final/{date}.jsonl"
     report_path= report_path or f"reports/daily/{date}-ai.md"
 
-    # index AI by id
-    ai_by_id = {r["id"]: r for r in load_jsonl(in_ai)}
-    rows, stats = [], {
-        "n": 0, "avg": 0.0, "stances": Counter(), "tags": Counter(), "vol": 0
-    }
+    # infer.py writes ai_out in bundle order (one row per bundle), so the
+    # common case is a straight zip-walk with no id index at all; the dict
+    # is only built from the unconsumed remainder if the files diverge.
+    ai_iter = load_jsonl(in_ai)
+    ai_next = next(ai_iter, None)
+    ai_by_id = None
+
+    rows = []
+    n, sum_score, vol = 0, 0.0, 0
+    stances, tag_counts = Counter(), Counter()
 
     for b in load_jsonl(in_bundles):
         aid = b.get("id")
-        ai = ai_by_id.get(aid)
+        if ai_by_id is None:
+            if ai_next is not None and ai_next.get("id") == aid:
+                ai = ai_next
+                ai_next = next(ai_iter, None)
+            else:
+                # order diverged — index what's left and fall back to lookups
+                ai_by_id = {}
+                if ai_next is not None:
+                    ai_by_id[ai_next.get("id")] = ai_next
+                    ai_next = None
+                for r in ai_iter:
+                    ai_by_id[r.get("id")] = r
+                ai = ai_by_id.get(aid)
+        else:
+            ai = ai_by_id.get(aid)
         if not ai:
             # keep record but mark missing
             merged = {
@@ -92,17 +143,21 @@ def merge(date:str, in_bundles:str|None=None, in_ai:str|None=None, out_path:str|
         }
         rows.append(merged)
 
-        # stats
-        stats["n"] += 1
-        stats["avg"] += score
-        stats["stances"][ai.get("stance","neutral")] += 1
-        stats["vol"] += 1 if b.get("rule_features",{}).get("vol_flags") else 0
+        # stats (locals in the loop; packed into a dict below)
+        n += 1
+        sum_score += score
+        stances[ai.get("stance","neutral")] += 1
+        vol += 1 if b.get("rule_features",{}).get("vol_flags") else 0
         for t in ai.get("narrative_tags", []):
-            stats["tags"][t] += 1
-
-    # finalize average
-    if stats["n"] > 0:
-        stats["avg"] = round(stats["avg"]/stats["n"], 1)
+            tag_counts[t] += 1
+
+    stats = {
+        "n": n,
+        "avg": round(sum_score/n, 1) if n > 0 else 0.0,
+        "stances": stances,
+        "tags": tag_counts,
+        "vol": vol,
+    }
 
     save_jsonl(out_path, rows)
     write_report(report_path, date, stats, rows)
@@ -110,27 +165,29 @@ def merge(date:str, in_bundles:str|None=None, in_ai:str|None=None, out_path:str|
     return rows, stats
 
 def write_report(path:str, date:str, stats:dict, rows:list[dict]):
-    lines = []
-    lines.append(f"# AI Narrative Report — {date}")
-    lines.append(f"- Items with AI: **{stats['n']}**   Avg score: **{stats['avg']}**   Vol triggers: **{stats['vol']}**")
+    buf = io.StringIO()
+    buf.write(f"# AI Narrative Report — {date}\n")
+    buf.write(f"- Items with AI: **{stats['n']}**   Avg score: **{stats['avg']}**   Vol triggers: **{stats['vol']}**\n")
     if stats["stances"]:
         total = stats["n"] or 1
         stance_line = " / ".join(f"{k}: {int(100*v/total)}%" for k,v in stats["stances"].items())
-        lines.append(f"- Stance split: {stance_line}")
+        buf.write(f"- Stance split: {stance_line}\n")
     if stats["tags"]:
         top_tags = ", ".join(f"{t}×{c}" for t,c in stats["tags"].most_common(6))
-        lines.append(f"- Top tags: {top_tags}")
-    lines.append("\n## Top items")
-    top = sorted([r for r in rows if r.get("score") is not None], key=lambda x: x["score"], reverse=True)[:10]
+        buf.write(f"- Top tags: {top_tags}\n")
+    buf.write("\n## Top items")
+    # O(N log 10) top-K instead of sorting all rows
+    top = heapq.nlargest(10, (r for r in rows if r.get("score") is not None),
+                         key=lambda r: r["score"])
     for r in top:
         src = r.get("source") or "?"
         ttl = r.get("title") or "?"
         sc  = r.get("score")
         st  = (r.get("ai") or {}).get("stance")
-        lines.append(f"- **{sc}** · {src} · *{st}* — {ttl}")
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+        buf.write(f"\n- **{sc}** · {src} · *{st}* — {ttl}")
+    _ensure_dir(os.path.dirname(path))
     with open(path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(buf.getvalue())
 
 def main():
     ap = argparse.ArgumentParser()
@@ -15,7 +15,6 @@ Logs everything to reports/daily/DATE.log.
 import argparse
 import sys
 import traceback
-import statistics
 import json
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -27,20 +26,46 @@ AI_FINAL_DIR = Path("data/ai_final")
 DRIFT_DIR = Path("data/drift")
 REPORTS_DAILY_DIR = Path("reports/daily")
 
+# In-process stage runners (imports are lazy so one stage's deps don't
+# block the others from loading)
+def _stage_build(date):
+    from src.build_ai_bundle import build, load_rules
+    rules = load_rules("config/vanta_rules.yaml")
+    build(f"data/processed/{date}*.jsonl", f"data/ai_bundles/{date}.jsonl", rules)
+
+def _stage_infer(date):
+    from ai_layer.infer import run
+    run(date)
+
+def _stage_interpret(date):
+    from ai_layer.interpreter import merge
+    merge(date)
+
+def _stage_validate(date):
+    from src.validate_outputs import validate
+    errors = validate(date)
+    if errors:
+        for e in errors:
+            print(f"::error::{e}")
+        raise RuntimeError("validation failed")
+    print(f"::notice::Validation passed for {date}")
+
 STAGES = [
-    ("Build AI bundles", ["python", "-m", "src.build_ai_bundle"]),
-    ("AI infer (VANTA1/2)", ["python", "-m", "ai_layer.infer"]),
-    ("Interpret & score (final)", ["python", "-m", "ai_layer.interpreter"]),
+    ("Build AI bundles", "src.build_ai_bundle", _stage_build),
+    ("AI infer (VANTA1/2)", "ai_layer.infer", _stage_infer),
+    ("Interpret & score (final)", "ai_layer.interpreter", _stage_interpret),
     # Drift integrated below instead of calling ai_layer.drfit
-    ("Rebuild report (with drift)", ["python", "-m", "ai_layer.interpreter"]),
-    ("Validate outputs", ["python", "-m", "src.validate_outputs"]),
+    ("Rebuild report (with drift)", "ai_layer.interpreter", _stage_interpret),
+    ("Validate outputs", "src.validate_outputs", _stage_validate),
 ]
 
-def run_stage(name, cmd, date):
+def run_stage(name, module, fn, date, use_subprocess=False):
     print(f"\n=== Stage: {name} ===")
-    full_cmd = cmd + ["--date", date]
     try:
-        subprocess.run(full_cmd, check=True)
+        if use_subprocess:
+            subprocess.run(["python", "-m", module, "--date", date], check=True)
+        else:
+            fn(date)
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Stage '{name}' failed with exit code {e.returncode}")
         sys.exit(e.returncode)
@@ -91,37 +116,36 @@ def load_jsonl(path: Path):
                 pass
     return items
 
-def safe_mean(vals):
-    vals = [v for v in vals if isinstance(v, (int, float))]
-    return round(statistics.mean(vals), 4) if vals else None
-
-def safe_range(vals):
-    vals = [v for v in vals if isinstance(v, (int, float))]
-    return (min(vals), max(vals)) if vals else None
-
-def extract_sentiment(item):
-    if "sentiment" in item and isinstance(item["sentiment"], (int, float)):
-        return item["sentiment"]
-    if "ai" in item and isinstance(item["ai"], dict):
-        val = item["ai"].get("sentiment")
-        return val if isinstance(val, (int, float)) else None
-    return None
-
-def extract_score(item):
-    if "score" in item and isinstance(item["score"], (int, float)):
-        return item["score"]
-    if "ai" in item and isinstance(item["ai"], dict):
-        val = item["ai"].get("score")
-        return val if isinstance(val, (int, float)) else None
-    return None
+class _RunningStat:
+    """Online sum/count/min/max accumulator (one pass, no value lists)."""
+    __slots__ = ("total", "n", "lo", "hi")
+
+    def __init__(self):
+        self.total, self.n, self.lo, self.hi = 0.0, 0, None, None
+
+    def add(self, v):
+        if isinstance(v, (int, float)):
+            self.total += v
+            self.n += 1
+            if self.lo is None or v < self.lo:
+                self.lo = v
+            if self.hi is None or v > self.hi:
+                self.hi = v
+
+    def mean(self):
+        return round(self.total / self.n, 4) if self.n else None
+
+    def range(self):
+        return (self.lo, self.hi) if self.n else None
 
 def run_drift(date: str, lookback: int = 7):
     print(f"\n=== Stage: Drift scoring (lookback {lookback} days) ===")
     history = []
     date_obj = datetime.strptime(date, "%Y-%m-%d")
-    for i in range(lookback):
-        day = date_obj - timedelta(days=i)
-        for fp in AI_FINAL_DIR.glob(f"{day.date()}*.jsonl"):
+    # one directory listing + set probe per file, not one glob per day
+    wanted = {(date_obj - timedelta(days=i)).date().isoformat() for i in range(lookback)}
+    for fp in AI_FINAL_DIR.glob("*.jsonl"):
+        if fp.name[:10] in wanted:
             history.extend(load_jsonl(fp))
 
     drift_file = DRIFT_DIR / f"{date}_drift.json"
@@ -139,17 +163,29 @@ def run_drift(date: str, lookback: int = 7):
         }, indent=2))
         return
 
-    sentiments = [extract_sentiment(x) for x in history]
-    scores = [extract_score(x) for x in history]
+    # Single pass: pull sentiment/score per item and feed the accumulators
+    sent, score = _RunningStat(), _RunningStat()
+    for x in history:
+        ai = x.get("ai")
+        if not isinstance(ai, dict):
+            ai = None
+        v = x.get("sentiment")
+        if not isinstance(v, (int, float)) and ai:
+            v = ai.get("sentiment")
+        sent.add(v)
+        v = x.get("score")
+        if not isinstance(v, (int, float)) and ai:
+            v = ai.get("score")
+        score.add(v)
 
     drift_stats = {
         "date": date,
         "lookback_days": lookback,
         "items_count": len(history),
-        "avg_sentiment": safe_mean(sentiments),
-        "avg_score": safe_mean(scores),
-        "sentiment_range": safe_range(sentiments),
-        "score_range": safe_range(scores)
+        "avg_sentiment": sent.mean(),
+        "avg_score": score.mean(),
+        "sentiment_range": sent.range(),
+        "score_range": score.range()
     }
 
     drift_file.write_text(json.dumps(drift_stats, indent=2))
@@ -160,6 +196,8 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--date", default="", help="YYYY-MM-DD (UTC). Leave empty for auto.")
     parser.add_argument("--lookback", type=int, default=7, help="Days to look back for drift scoring")
+    parser.add_argument("--subprocess", action="store_true",
+                        help="Run each stage as 'python -m ...' (slower; for debugging).")
     args = parser.parse_args()
 
     date = resolve_date(args.date)
@@ -177,15 +215,15 @@ def main():
         sys.stdout = sys.stderr = lf
         try:
             # Pre-drift stages
-            for name, cmd in STAGES[:3]:
-                run_stage(name, cmd, date)
+            for name, module, fn in STAGES[:3]:
+                run_stage(name, module, fn, date, use_subprocess=args.subprocess)
 
             # Drift stage
             run_drift(date, lookback=args.lookback)
 
             # Post-drift stages
-            for name, cmd in STAGES[3:]:
-                run_stage(name, cmd, date)
+            for name, module, fn in STAGES[3:]:
+                run_stage(name, module, fn, date, use_subprocess=args.subprocess)
 
         except SystemExit as e:
             raise
@@ -15,7 +15,9 @@ Other features preserved:
 - CLI: --force-refresh, --skip-days, plus new --timeout/--retries/--backoff
 """
 
-import os, json, csv, re, html, hashlib, time, argparse, socket, gzip, io
+import os, json, re, html, hashlib, time, argparse, socket, gzip, io, functools, shutil, mmap, threading, heapq
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 import urllib.request, urllib.error
@@ -33,12 +35,57 @@ try:
 except Exception:
     BeautifulSoup = None
 
+try:
+    import ahocorasick  # type: ignore
+except Exception:
+    ahocorasick = None
+
+try:
+    import xxhash  # type: ignore
+except Exception:
+    xxhash = None
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+# Preferred XML parser for the fast path: lxml if installed, else the
+# stdlib C ElementTree. feedparser remains the tolerant fallback.
+try:
+    from lxml import etree as _ET  # type: ignore
+except Exception:
+    import xml.etree.ElementTree as _ET
+
+# lxml.html strips tags in C and handles malformed markup the tag regex
+# chokes on (unclosed tags, attributes containing ">").
+try:
+    import lxml.html as _lxml_html  # type: ignore
+except Exception:
+    _lxml_html = None
+
+# orjson emits UTF-8 bytes directly (no TextIOWrapper re-encode); all the
+# JSON outputs below are written in binary mode through these two helpers.
+if orjson:
+    def _json_line(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    def _json_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+else:
+    def _json_line(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def _json_pretty(obj) -> bytes:
+        return (json.dumps(obj, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
 # ==================== CONFIG ====================
 OUT_DIR         = "docs"
 ARCHIVE_DIR     = os.path.join(OUT_DIR, "archive")
 ARCHIVE_SNAPSHOTS = True
 
 JSONL_PATH   = os.path.join(OUT_DIR, "articles.jsonl")
+FEED_CACHE_PATH = os.path.join(OUT_DIR, "feed_cache.json")
 CSV_PATH     = os.path.join(OUT_DIR, "articles.csv")
 LATEST_PATH  = os.path.join(OUT_DIR, "latest.json")
 STATUS_PATH  = os.path.join(OUT_DIR, "status.json")
@@ -55,7 +102,7 @@ SKIP_OLDER_DAYS     = 10
 PER_FEED_CAP        = 50
 LATEST_LIMIT        = 1000
 JSONL_MAX_ROWS      = 5000
-SLEEP_BETWEEN_FEEDS = 0.6  # seconds
+FETCH_WORKERS       = 8   # parallel feed fetches (network-bound)
 
 # HTTP defaults (overridable via CLI/env)
 REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "12"))
@@ -132,13 +179,59 @@ ALLOWLIST_DOMAINS = {
 }
 
 # ==================== HELPERS ====================
-_rx_inc = re.compile("|".join([re.escape(k) for k in KEYWORDS_INCLUDE]), re.I) if KEYWORDS_INCLUDE else None
-_rx_exc = re.compile("|".join([re.escape(k) for k in KEYWORDS_EXCLUDE]), re.I) if KEYWORDS_EXCLUDE else None
-
+# One Aho-Corasick automaton holds both keyword lists, each word tagged
+# include/exclude, so the text is walked exactly once per entry; regex
+# alternations stay as a fallback when pyahocorasick is absent.
+if ahocorasick:
+    _ac_all = ahocorasick.Automaton()
+    for _w in KEYWORDS_INCLUDE:
+        _ac_all.add_word(_w.lower(), "inc")
+    for _w in KEYWORDS_EXCLUDE:
+        _ac_all.add_word(_w.lower(), "exc")  # excludes win on overlap
+    _ac_all.make_automaton()
+    _rx_inc = _rx_exc = None
+else:
+    _ac_all = None
+    _rx_inc = re.compile("|".join([re.escape(k) for k in KEYWORDS_INCLUDE]), re.I) if KEYWORDS_INCLUDE else None
+    _rx_exc = re.compile("|".join([re.escape(k) for k in KEYWORDS_EXCLUDE]), re.I) if KEYWORDS_EXCLUDE else None
+
+# Highest-signal include keywords, checked with C-level str.__contains__
+# before the fallback regex walk. These are verbatim members of
+# KEYWORDS_INCLUDE, so a hit is a real match (fast accept, never a lossy
+# reject) and a miss simply falls through to the full scan.
+_INC_FAST_HITS = ("btc", "eth", "etf", "sec", "cpi", "fomc", "defi", "xrp")
+
+def _classify(txt_lower: str) -> tuple[bool, bool]:
+    """One pass over the lowered text → (not_excluded, include_hit)."""
+    if _ac_all is not None:
+        saw_inc = False
+        for _, kind in _ac_all.iter(txt_lower):
+            if kind == "exc":
+                return False, saw_inc
+            saw_inc = True
+        return True, saw_inc
+    if _rx_exc and _rx_exc.search(txt_lower):
+        return False, False
+    inc = (any(tok in txt_lower for tok in _INC_FAST_HITS)
+           or bool(_rx_inc is None or _rx_inc.search(txt_lower)))
+    return True, inc
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_url(u: str) -> str:
     if not u:
         return ""
+    # Fast path: nothing to strip for the vast majority of RSS links.
+    if "?" not in u and "#" not in u:
+        return u
     try:
+        hash_i = u.find("#")
+        if hash_i >= 0:
+            u = u[:hash_i]
+        q_i = u.find("?")
+        # only the query can carry utm_ params — don't let a path that
+        # happens to contain "utm_" force the full parse round-trip
+        if q_i < 0 or "utm_" not in u[q_i:].lower():
+            return u
         p = urlparse(u)
         q = [(k, v) for (k, v) in parse_qsl(p.query, keep_blank_values=True)
              if not k.lower().startswith("utm_")]
@@ -146,23 +239,74 @@ def _normalize_url(u: str) -> str:
     except Exception:
         return u
 
+@functools.lru_cache(maxsize=8192)
 def _domain(u: str) -> str:
     try:
         return urlparse(u).netloc.lower()
     except Exception:
         return ""
 
+_ALLOW_SET = frozenset(ALLOWLIST_DOMAINS)
+
+@functools.lru_cache(maxsize=4096)
+def _on_allowlist(d: str) -> bool:
+    # Walk the domain's label suffixes right-to-left (a.b.sec.gov →
+    # a.b.sec.gov, b.sec.gov, sec.gov): at most a handful of set probes,
+    # independent of allowlist size.
+    while d:
+        if d in _ALLOW_SET:
+            return True
+        _, _, d = d.partition(".")
+    return False
+
 def _allowed(feed_url: str, link_url: str) -> bool:
-    d1, d2 = _domain(feed_url), _domain(link_url)
-    def on_list(d): return any(d == dom or d.endswith("." + dom) for dom in ALLOWLIST_DOMAINS)
-    return on_list(d1) or on_list(d2)
+    return _on_allowlist(_domain(feed_url)) or _on_allowlist(_domain(link_url))
+
+_TAG_RX = re.compile(r"<[^>]+>")
+_WS_RX = re.compile(r"\s+")
 
 def _clean_summary(s: str) -> str:
     if not s:
         return ""
-    s = re.sub(r"<[^>]+>", " ", s)
-    s = html.unescape(s)
-    return re.sub(r"\s+", " ", s).strip()
+    if "<" in s:  # most summaries carry no HTML at all
+        if _lxml_html is not None:
+            try:
+                return " ".join(_lxml_html.fromstring(s).text_content().split())
+            except Exception:
+                pass
+        s = _TAG_RX.sub(" ", s)
+    return _WS_RX.sub(" ", html.unescape(s)).strip()
+
+# Fast paths for the two date shapes that cover nearly all real feeds;
+# feedparser._parse_date (regex-heavy) only runs on a miss.
+_RFC822_RX = re.compile(
+    r"^(?:[A-Za-z]{3}, )?(\d{1,2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2})(?: ([+-]\d{4}|GMT|UTC?|Z))?\s*$")
+_ISO_DT_RX = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.\d+)?(Z|[+-]\d{2}:?\d{2})?\s*$")
+_MONTHS = {m: i for i, m in enumerate(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1)}
+
+def _tz_offset_min(tz: str | None) -> int:
+    if not tz or tz in ("Z", "GMT", "UT", "UTC"):
+        return 0
+    tz = tz.replace(":", "")
+    sign = -1 if tz[0] == "-" else 1
+    return sign * (int(tz[1:3]) * 60 + int(tz[3:5]))
+
+def _parse_dt_str(val: str):
+    m = _ISO_DT_RX.match(val)
+    if m:
+        y, mo, d, hh, mm, ss, tz = m.groups()
+        dt = datetime(int(y), int(mo), int(d), int(hh), int(mm), int(ss), tzinfo=timezone.utc)
+        return dt - timedelta(minutes=_tz_offset_min(tz))
+    m = _RFC822_RX.match(val)
+    if m:
+        d, mon, y, hh, mm, ss, tz = m.groups()
+        mon_i = _MONTHS.get(mon.capitalize())
+        if mon_i:
+            dt = datetime(int(y), mon_i, int(d), int(hh), int(mm), int(ss), tzinfo=timezone.utc)
+            return dt - timedelta(minutes=_tz_offset_min(tz))
+    return None
 
 def _parse_dt(entry, feed_url: str):
     try:
@@ -175,6 +319,12 @@ def _parse_dt(entry, feed_url: str):
         val = entry.get(key)
         if not val:
             continue
+        try:
+            dt = _parse_dt_str(val.strip())
+            if dt:
+                return dt
+        except Exception:
+            pass
         try:
             tt = feedparser._parse_date(val)
             if tt:
@@ -188,29 +338,58 @@ def _parse_dt(entry, feed_url: str):
     return datetime.now(timezone.utc)
 
 def _passes_keywords(title: str, summary: str) -> bool:
-    txt = f"{title or ''} {summary or ''}"
-    if _rx_exc and _rx_exc.search(txt):
-        return False
-    if _rx_inc and not _rx_inc.search(txt):
-        return False
-    return True
-
-def _dedupe_key(title: str, link: str) -> str:
-    t = (title or "").strip().lower()
-    t = re.sub(r"\s+", " ", t)
-    return hashlib.sha256(f"{t}|{_normalize_url(link)}".encode("utf-8")).hexdigest()
+    ok, inc = _classify(f"{title or ''} {summary or ''}".lower())
+    return ok and inc
+
+# Dedupe keys are dict/set keys only — no security boundary — so prefer a
+# fast 64-bit non-cryptographic hash when xxhash is installed. Old SHA-256
+# keys in existing archives stay valid: they are just longer unique strings.
+_ID_KEY_RX = re.compile(rb'"id_key":\s*"([0-9a-f]{16,64})"')
+
+# Digests live in sets as plain ints (8 bytes of payload vs ~120 bytes for
+# a hex-string key); the hex form is only materialized at serialization
+# time and round-trips back through int(hex, 16) on archive load.
+if xxhash:
+    def _hash_int(s: str) -> int:
+        return xxhash.xxh3_64_intdigest(s)
+
+    def _hash_hex(v: int) -> str:
+        return f"{v:016x}"
+else:
+    # BLAKE2b-128: ~2x faster than SHA-256 on short inputs without SHA-NI
+    # and half the serialized width; old 64-char SHA keys still round-trip.
+    def _hash_int(s: str) -> int:
+        return int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=16).digest(), "big")
+
+    def _hash_hex(v: int) -> str:
+        return f"{v:032x}"
+
+def _dedupe_key(title: str, link: str) -> int:
+    """Stable title+URL digest (int). `link` must already be normalized
+    (main() only ever handles _normalize_url output), so no second
+    parse+rebuild happens here."""
+    t = " ".join((title or "").lower().split())
+    return _hash_int(f"{t}|{link}")
 
 # ---- Feed list parsing with health tags ----
 _TAG_RE = re.compile(r"\[(.*?)\]")
 def _parse_feed_line(line: str):
+    # one finditer pass collects tags and the non-tag spans together
+    # (findall + sub walked the line twice)
     tags = {}
-    for m in _TAG_RE.findall(line):
-        if "=" in m:
-            k, v = m.split("=", 1)
+    parts = []
+    last = 0
+    for m in _TAG_RE.finditer(line):
+        parts.append(line[last:m.start()])
+        last = m.end()
+        body = m.group(1)
+        if "=" in body:
+            k, v = body.split("=", 1)
             tags[k.strip().upper()] = v.strip()
         else:
-            tags[m.strip().upper()] = True
-    line_clean = _TAG_RE.sub("", line).strip()
+            tags[body.strip().upper()] = True
+    parts.append(line[last:])
+    line_clean = "".join(parts).strip()
     src, url = "", ""
     if "\t" in line_clean:
         src, url = line_clean.split("\t", 1)
@@ -237,17 +416,47 @@ def _load_feeds():
     return out
 
 # ---- CSV sanitization ----
+# One translate() pass instead of five chained .replace() walks
+_CSV_KILL = str.maketrans({"\r": " ", "\n": " ", "\u2028": " ", "\u2029": " ", "\x00": " "})
+
 def _csv_clean(x) -> str:
-    if x is None:
-        return ""
-    s = str(x)
-    s = s.replace("\r", " ").replace("\n", " ").replace("\u2028", " ").replace("\u2029", " ")
-    s = s.replace("\x00", " ")
-    return s
-
-# ---- Low-level fetch (timeout + retries + gzip) ----
-def _urllib_fetch(url: str, timeout: int) -> tuple[bytes, str]:
-    req = urllib.request.Request(url, headers=REQ_HEADERS)
+    return "" if x is None else str(x).translate(_CSV_KILL)
+
+# ---- Low-level fetch (timeout + retries + gzip + conditional GET) ----
+# One pooled Session keeps connections alive across feeds on the same host,
+# with pools sized for the fetch workers and transport-level retries for
+# flaky status codes (the Python-level retry loop below handles the rest).
+if requests:
+    _session = requests.Session()
+    try:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _adapter = HTTPAdapter(
+            pool_connections=32, pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              allowed_methods=frozenset(["GET"])))
+        _session.mount("https://", _adapter)
+        _session.mount("http://", _adapter)
+    except Exception:
+        pass
+else:
+    _session = None
+
+class _NotModified(Exception):
+    """Server answered 304 for a conditional GET — feed unchanged."""
+
+def _cond_headers(cond: dict | None) -> dict:
+    h = dict(REQ_HEADERS)
+    if cond:
+        if cond.get("etag"):
+            h["If-None-Match"] = cond["etag"]
+        if cond.get("last_modified"):
+            h["If-Modified-Since"] = cond["last_modified"]
+    return h
+
+def _urllib_fetch(url: str, timeout: int, headers: dict) -> tuple[bytes, str, dict]:
+    req = urllib.request.Request(url, headers=headers)
     with urllib.request.urlopen(req, timeout=timeout) as r:
         data = r.read()
         enc = (r.headers.get("Content-Encoding") or "").lower()
@@ -257,25 +466,47 @@ def _urllib_fetch(url: str, timeout: int) -> tuple[bytes, str]:
             except Exception:
                 pass
         ctype = (r.headers.get("Content-Type") or "").lower()
-        return data, ctype
-
-def _fetch_bytes(url: str, timeout: int, retries: int, backoff: float) -> tuple[bytes, str]:
+        meta = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+        return data, ctype, meta
+
+def _fetch_bytes(url: str, timeout: int, retries: int, backoff: float,
+                 cond: dict | None = None) -> tuple[bytes, str, dict]:
+    """Fetch with retries. Returns (content, content_type, validators) where
+    validators carries any ETag/Last-Modified the server sent. Raises
+    _NotModified on a 304 answer to a conditional request."""
+    headers = _cond_headers(cond)
     last_err = None
     for attempt in range(retries + 1):
         try:
-            if requests:
-                r = requests.get(url, headers=REQ_HEADERS, timeout=timeout)
+            if _session:
+                r = _session.get(url, headers=headers, timeout=timeout)
+                if r.status_code == 304:
+                    raise _NotModified()
                 content = r.content  # requests auto-decompresses by default
                 ctype = (r.headers.get("Content-Type") or "").lower()
                 # allow 2xx only
                 if 200 <= r.status_code < 300 and content:
-                    return content, ctype
+                    meta = {"etag": r.headers.get("ETag"),
+                            "last_modified": r.headers.get("Last-Modified")}
+                    return content, ctype, meta
+                if r.status_code == 429:
+                    try:
+                        retry_after = float(r.headers.get("Retry-After") or 1.0)
+                    except ValueError:
+                        retry_after = 1.0  # HTTP-date form; just back off a beat
+                    _host_backoff(_domain(url), retry_after)
                 last_err = RuntimeError(f"HTTP {r.status_code}")
             else:
-                content, ctype = _urllib_fetch(url, timeout)
+                content, ctype, meta = _urllib_fetch(url, timeout, headers)
                 if content:
-                    return content, ctype
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, socket.timeout) as e:
+                    return content, ctype, meta
+        except _NotModified:
+            raise
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                raise _NotModified() from None
+            last_err = e
+        except (urllib.error.URLError, TimeoutError, socket.timeout) as e:
             last_err = e
         except Exception as e:
             last_err = e
@@ -293,7 +524,19 @@ def _fix_xml_encoding(s: bytes) -> str:
     text = text.replace("\x00", " ")
     return text
 
+_ALT_LINK_XPATH = ('//link[@rel="alternate" and (contains(@type,"rss") '
+                   'or contains(@type,"atom") or contains(@type,"xml"))]')
+
 def _discover_rss_in_html(html_text: str, base_url: str) -> str:
+    if _lxml_html is not None:
+        try:
+            from urllib.parse import urljoin
+            doc = _lxml_html.fromstring(html_text)
+            for ln in doc.xpath(_ALT_LINK_XPATH):
+                return urljoin(base_url, ln.get("href") or "")
+            return ""
+        except Exception:
+            pass
     if not BeautifulSoup:
         return ""
     try:
@@ -309,42 +552,179 @@ def _discover_rss_in_html(html_text: str, base_url: str) -> str:
         pass
     return ""
 
+# ---- Fast XML parse path (lxml / C ElementTree) ----
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+class _FastParsed:
+    """Minimal feedparser-shaped result: .entries, .feed.title, .bozo."""
+    __slots__ = ("entries", "feed", "bozo")
+
+    def __init__(self, entries, title):
+        self.entries = entries
+        self.feed = _FastFeedMeta(title)
+        self.bozo = 0
+
+class _FastFeedMeta:
+    __slots__ = ("title",)
+
+    def __init__(self, title):
+        self.title = title
+
+def _rss_item(it: "_ET.Element") -> dict:
+    return {
+        "title": it.findtext("title") or "",
+        "link": (it.findtext("link") or "").strip(),
+        "summary": it.findtext("description") or "",
+        "published": (it.findtext("pubDate")
+                      or it.findtext("{http://purl.org/dc/elements/1.1/}date") or ""),
+    }
+
+def _atom_entry(it: "_ET.Element") -> dict:
+    link = ""
+    for le in it.findall(_ATOM + "link"):
+        if le.get("rel", "alternate") == "alternate":
+            link = le.get("href", "")
+            break
+    return {
+        "title": it.findtext(_ATOM + "title") or "",
+        "link": link.strip(),
+        "summary": (it.findtext(_ATOM + "summary")
+                    or it.findtext(_ATOM + "content") or ""),
+        "published": (it.findtext(_ATOM + "published")
+                      or it.findtext(_ATOM + "updated") or ""),
+    }
+
+def _parse_fast(text: str, per_cap: int = PER_FEED_CAP):
+    """Stream well-formed RSS 2.0 / Atom into entry dicts with a C XML
+    parser — an order of magnitude cheaper than feedparser's pure-Python
+    tolerant parse. iterparse stops as soon as per_cap items are built
+    and clears each item element, so a feed with thousands of entries
+    never materializes a full tree. Returns None for anything it doesn't
+    recognize so the caller can fall back to feedparser."""
+    entries: list = []
+    feed_title = ""
+    kind = None
+    in_item = False
+    try:
+        for ev, elem in _ET.iterparse(io.BytesIO(text.encode("utf-8")), events=("start", "end")):
+            tag = elem.tag
+            if ev == "start":
+                if kind is None:
+                    if tag == "rss":
+                        kind = "rss"
+                    elif tag == _ATOM + "feed":
+                        kind = "atom"
+                    else:
+                        return None
+                elif tag == ("item" if kind == "rss" else _ATOM + "entry"):
+                    in_item = True
+                continue
+            if kind == "rss" and tag == "item":
+                entries.append(_rss_item(elem))
+            elif kind == "atom" and tag == _ATOM + "entry":
+                entries.append(_atom_entry(elem))
+            else:
+                if not in_item and not feed_title and tag in ("title", _ATOM + "title"):
+                    feed_title = elem.text or ""
+                continue
+            elem.clear()
+            in_item = False
+            if len(entries) >= per_cap:
+                break
+    except Exception:
+        return None
+    if kind is None:
+        return None
+    return _FastParsed(entries, feed_title)
+
 # ---- Robust parse entry point (bounded time) ----
-def _parse_with_fallback(url: str, errors_list: list, timeout: int, retries: int, backoff: float):
+def _parse_with_fallback(url: str, errors_list: list, timeout: int, retries: int, backoff: float,
+                         cond: dict | None = None, per_cap: int = PER_FEED_CAP):
     """
-    1) Fetch bytes with strict timeout/retries
+    1) Fetch bytes with strict timeout/retries (conditional GET if we have
+       cached validators; 304 → (None, {"not_modified": True}))
     2) If HTML, discover alternate RSS and re-fetch
     3) Parse bytes via feedparser.parse(bytes)
+
+    Returns (parsed_or_None, validators_dict).
     """
     try:
-        raw, ctype = _fetch_bytes(url, timeout, retries, backoff)
+        raw, ctype, meta = _fetch_bytes(url, timeout, retries, backoff, cond=cond)
+    except _NotModified:
+        return None, {"not_modified": True}
     except Exception as ex:
         errors_list.append({"source": url, "error": f"fetch error: {ex}"})
-        return None
-
-    # If HTML, try to discover an alternate feed
-    if "text/html" in ctype or (raw[:64].lstrip().startswith(b"<!DOCTYPE html") or raw[:32].lstrip().lower().startswith(b"<html")):
-        alt = ""
-        if BeautifulSoup:
-            try:
-                html_text = raw.decode("utf-8", errors="replace")
-            except Exception:
-                html_text = raw.decode("latin-1", errors="replace")
-            alt = _discover_rss_in_html(html_text, url)
+        return None, {}
+
+    # Some servers ignore conditional GETs; a digest of the body catches an
+    # unchanged feed anyway and skips the parse.
+    body_hash = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    if cond and cond.get("body_hash") == body_hash:
+        return None, {"not_modified": True}
+    meta["body_hash"] = body_hash
+
+    # If HTML, try to discover an alternate feed. One lowercased sniff of
+    # the head covers both doctype spellings without extra slices, and the
+    # decoded text is reused for discovery and (if no alt) the parse below.
+    fixed = _fix_xml_encoding(raw)
+    head_lc = raw[:512].lower()
+    if "text/html" in ctype or b"<!doctype html" in head_lc or b"<html" in head_lc:
+        alt = _discover_rss_in_html(fixed, url)
         if alt:
             try:
-                raw, ctype = _fetch_bytes(alt, timeout, retries, backoff)
+                raw, ctype, meta = _fetch_bytes(alt, timeout, retries, backoff)
+                fixed = _fix_xml_encoding(raw)
             except Exception as ex:
                 errors_list.append({"source": url, "error": f"alt feed fetch error: {ex}"})
                 # fall through and try to parse original HTML bytes (will likely be bozo)
 
-    fixed = _fix_xml_encoding(raw)
+    parsed = _parse_fast(fixed, per_cap)
+    if parsed is not None:
+        return parsed, meta
     try:
         parsed = feedparser.parse(fixed)
-        return parsed
+        return parsed, meta
     except Exception as ex:
         errors_list.append({"source": url, "error": f"parse bytes error: {ex}"})
-        return None
+        return None, meta
+
+# Per-host politeness: feeds on different hosts proceed immediately; two
+# hits on the same host are spaced at least _POLITE_GAP apart, and a 429
+# pushes the host's next-allowed time out by its Retry-After.
+_POLITE_GAP = 0.6
+_host_next_ok: dict[str, float] = {}
+_host_lock = threading.Lock()
+
+def _polite_wait(host: str):
+    while True:
+        with _host_lock:
+            now = time.monotonic()
+            ready = _host_next_ok.get(host, 0.0)
+            if now >= ready:
+                _host_next_ok[host] = now + _POLITE_GAP
+                return
+        time.sleep(ready - now)
+
+def _host_backoff(host: str, seconds: float):
+    with _host_lock:
+        _host_next_ok[host] = max(_host_next_ok.get(host, 0.0),
+                                  time.monotonic() + seconds)
+
+def _fetch_feed(feed_url: str, timeout: int, retries: int, backoff: float,
+                cond: dict | None = None, per_cap: int = PER_FEED_CAP):
+    """Worker for the fetch pool: fetch+parse one feed, no shared state
+    beyond the politeness gate.
+
+    Returns (parsed_or_None, meta, errors, elapsed_seconds); all filtering
+    and dedupe stays on the main thread.
+    """
+    errs: list = []
+    _polite_wait(_domain(feed_url))
+    t0 = time.time()
+    parsed, meta = _parse_with_fallback(feed_url, errors_list=errs,
+                                        timeout=timeout, retries=retries, backoff=backoff,
+                                        cond=cond, per_cap=per_cap)
+    return parsed, meta, errs, time.time() - t0
 
 # ==================== MAIN ====================
 def main():
@@ -375,49 +755,25 @@ def main():
     start_ts = datetime.now(timezone.utc)
     feeds = _load_feeds()
 
-    # Load previous JSONL and migrate fields
-    old_items = []
-    if os.path.exists(JSONL_PATH) and not args.force_refresh:
-        with open(JSONL_PATH, "r", encoding="utf-8") as f:
-            for ln in f:
-                try:
-                    o = json.loads(ln)
-                    # migrate published_utc to YYYY-MM-DD and hydrate retrieved fields
-                    pu = o.get("published_utc", "")
-                    if pu:
-                        if len(pu) >= 10 and pu[4] == "-" and pu[7] == "-":
-                            o["published_utc"] = pu[:10]
-                        else:
-                            try:
-                                dd = datetime.fromisoformat(pu.replace("Z", "+00:00"))
-                            except Exception:
-                                dd = datetime.now(timezone.utc)
-                            o["published_utc"] = dd.strftime("%Y-%m-%d")
-                    else:
-                        iu = o.get("ingested_utc", "")
-                        o["published_utc"] = (iu[:10] if len(iu) >= 10 and iu[4] == "-"
-                                              else datetime.now(timezone.utc).strftime("%Y-%m-%d"))
-
-                    if not o.get("retrieved_date"):
-                        iu = o.get("ingested_utc", "")
-                        o["retrieved_date"] = (iu[:10] if len(iu) >= 10 and iu[4] == "-"
-                                               else datetime.now(timezone.utc).strftime("%Y-%m-%d"))
-                    # NEW: ensure retrieved_utc exists for downstream AI bundle freshness
-                    if not o.get("retrieved_utc"):
-                        iu = o.get("ingested_utc")
-                        if isinstance(iu, str) and len(iu) >= 20:
-                            o["retrieved_utc"] = iu
-                        else:
-                            rd = o.get("retrieved_date") or o.get("published_utc")
-                            # midnight UTC fallback if only a date is known
-                            o["retrieved_utc"] = f"{rd}T00:00:00Z" if rd else datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-                    o["summary"] = _clean_summary(o.get("summary", ""))
-                    old_items.append(o)
-                except Exception:
-                    pass
-
-    exist_ids = {o.get("id_key") for o in old_items if o.get("id_key")}
+    # Tail-read previous JSONL: keep only the newest JSONL_MAX_ROWS raw
+    # lines and harvest id_keys with a byte regex — no json.loads, no
+    # per-row migration. Rows written by this scraper already carry all
+    # fields, so the old legacy-field hydration pass is gone with the
+    # full-file rewrite it supported.
+    old_lines: deque = deque(maxlen=JSONL_MAX_ROWS)
+    exist_ids = set()
+    if os.path.exists(JSONL_PATH) and not args.force_refresh and os.path.getsize(JSONL_PATH):
+        with open(JSONL_PATH, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                # One C-level regex sweep over the mapped file picks up every
+                # id_key — including rows older than the tail window — so
+                # dedupe covers the whole archive without a json.loads.
+                exist_ids = {int(m.group(1), 16) for m in _ID_KEY_RX.finditer(mm)}
+                old_lines = deque(iter(mm.readline, b""), maxlen=JSONL_MAX_ROWS)
+            finally:
+                mm.close()
+    archive_rows = len(exist_ids)  # pre-compaction archive has one id per row
     new_items = []
     seen_title_url = set()
     by_source = {}
@@ -436,6 +792,10 @@ def main():
     }
     errors = []
 
+    # Split feeds into skipped and fetchable up front, then fan the network
+    # work out over a thread pool; entry filtering/dedupe below runs on the
+    # main thread as results arrive so all shared state stays lock-free.
+    work = []
     for (src_name, feed_url, tags) in feeds:
         tag_keys = {k.upper(): v for k, v in (tags or {}).items()}
         if "BROKEN" in tag_keys or "SKIP" in tag_keys:
@@ -449,22 +809,64 @@ def main():
                 per_cap = max(1, int(tag_keys["CAP"]))
             except Exception:
                 pass
+        work.append((src_name, feed_url, per_cap))
+
+    # Cached HTTP validators (ETag/Last-Modified) per feed URL → conditional
+    # GETs; an unchanged feed costs one 304 round-trip, no body, no parse.
+    feed_cache = {}
+    if os.path.exists(FEED_CACHE_PATH) and not args.force_refresh:
+        try:
+            with open(FEED_CACHE_PATH, "r", encoding="utf-8") as f:
+                feed_cache = json.load(f)
+        except Exception:
+            feed_cache = {}
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        futures = {
+            pool.submit(_fetch_feed, feed_url, REQUEST_TIMEOUT, MAX_RETRIES, RETRY_BACKOFF,
+                        feed_cache.get(feed_url), per_cap):
+                (src_name, feed_url, per_cap)
+            for (src_name, feed_url, per_cap) in work
+        }
+        results = []
+        for fut in as_completed(futures):
+            src_name, feed_url, per_cap = futures[fut]
+            try:
+                parsed, meta, errs, elapsed = fut.result()
+            except Exception as ex:
+                parsed, meta, errs, elapsed = None, {}, [{"source": src_name or feed_url,
+                                                          "error": f"worker error: {ex}"}], 0.0
+            results.append((src_name, feed_url, per_cap, parsed, meta, errs, elapsed))
+
+    # One run-level timestamp: sub-second precision is irrelevant here and
+    # the strftime/syscall per entry is not free.
+    ingested_now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    for (src_name, feed_url, per_cap, parsed, meta, errs, elapsed) in results:
+        errors.extend(errs)
 
         added, skipped = 0, 0
-        t0 = time.time()
         try:
-            parsed = _parse_with_fallback(feed_url, errors_list=errors,
-                                          timeout=REQUEST_TIMEOUT, retries=MAX_RETRIES, backoff=RETRY_BACKOFF)
+            if meta.get("not_modified"):
+                stats["feeds_not_modified"] = stats.get("feeds_not_modified", 0) + 1
+                by_source[src_name or feed_url] = by_source.get(src_name or feed_url, 0) + 0
+                print(f"[FEED] {src_name or feed_url} → Not modified (304) | {elapsed:.2f}s")
+                continue
+            if meta.get("etag") or meta.get("last_modified") or meta.get("body_hash"):
+                feed_cache[feed_url] = {"etag": meta.get("etag"),
+                                        "last_modified": meta.get("last_modified"),
+                                        "body_hash": meta.get("body_hash"),
+                                        "checked_utc": ingested_now}
+
             if parsed is None:
                 stats["feeds_error"] += 1
                 errors.append({"source": src_name or feed_url, "error": "fatal parse failure"})
                 by_source[src_name or feed_url] = by_source.get(src_name or feed_url, 0) + 0
-                elapsed = time.time() - t0
                 print(f"[FEED] {src_name or feed_url} → Added: 0, Skipped: 0 (fatal) | {elapsed:.2f}s")
-                time.sleep(SLEEP_BETWEEN_FEEDS)
                 continue
 
             entries = list(getattr(parsed, "entries", []) or [])[:per_cap]
+            feed_on_allow = _on_allowlist(_domain(feed_url))  # constant across the feed's entries
 
             if int(getattr(parsed, "bozo", 0) or 0):
                 errors.append({"source": src_name or feed_url,
@@ -483,13 +885,14 @@ def main():
                         skipped += 1
                         continue
 
-                    allowed = _allowed(feed_url, link)
-                    if _rx_exc and _rx_exc.search(f"{title} {summary}"):
+                    allowed = feed_on_allow or _on_allowlist(_domain(link))
+                    ok, had_inc = _classify(f"{title} {summary}".lower())
+                    if not ok:
                         stats["failed_all_filters"] += 1
                         skipped += 1
                         continue
                     if not allowed:
-                        if not _passes_keywords(title, summary):
+                        if not had_inc:
                             stats["failed_all_filters"] += 1
                             skipped += 1
                             continue
@@ -498,26 +901,27 @@ def main():
                     else:
                         stats["passed_allowlist"] += 1
 
-                    dk = _dedupe_key(title, link)
-                    if dk in seen_title_url:
+                    tk = _dedupe_key(title, link)
+                    if tk in seen_title_url:
                         stats["dup_title_url"] += 1
                         skipped += 1
                         continue
-                    seen_title_url.add(dk)
+                    seen_title_url.add(tk)
 
-                    ingested_now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
                     src_label = (src_name or getattr(parsed.feed, "title", "") or "").strip()
-                    base = f"{src_label}|{title}|{link}|{pub_dt.strftime('%Y-%m-%d')}"
-                    id_key = hashlib.sha256(base.encode("utf-8")).hexdigest()
-                    if id_key in exist_ids:
+                    pub_date = pub_dt.strftime("%Y-%m-%d")
+                    base = f"{src_label}|{title}|{link}|{pub_date}"
+                    id_int = _hash_int(base)
+                    if id_int in exist_ids:
                         stats["dup_id"] += 1
                         skipped += 1
                         continue
-                    exist_ids.add(id_key)
+                    exist_ids.add(id_int)
+                    id_key = _hash_hex(id_int)
 
                     # CHANGE: include retrieved_utc alongside retrieved_date
                     item = {
-                        "published_utc": pub_dt.strftime("%Y-%m-%d"),
+                        "published_utc": pub_date,
                         "retrieved_date": ingested_now[:10],
                         "retrieved_utc": ingested_now,   # <-- added for AI bundle freshness calc
                         "source": src_label,
@@ -532,57 +936,65 @@ def main():
                 except Exception as inner_ex:
                     errors.append({"source": src_name or feed_url, "error": f"entry error: {inner_ex}"})
                     skipped += 1
-        except (urllib.error.URLError, urllib.error.HTTPError, TimeoutError, socket.timeout) as net_ex:
-            stats["feeds_error"] += 1
-            if isinstance(net_ex, (TimeoutError, socket.timeout)):
-                stats["feeds_timeout"] += 1
-            else:
-                stats["feeds_http_error"] += 1
-            errors.append({"source": src_name or feed_url, "error": f"net: {net_ex.__class__.__name__}: {net_ex}"})
         except Exception as ex:
             stats["feeds_error"] += 1
             errors.append({"source": src_name or feed_url, "error": f"outer error: {ex}"})
 
-        elapsed = time.time() - t0
         by_source[src_name or feed_url] = by_source.get(src_name or feed_url, 0) + added
         print(f"[FEED] {src_name or feed_url} → Added: {added}, Skipped: {skipped} | {elapsed:.2f}s")
-        time.sleep(SLEEP_BETWEEN_FEEDS)
 
-    # Merge, sort, cap
+    if feed_cache:
+        with open(FEED_CACHE_PATH, "wb") as f:
+            f.write(_json_pretty(feed_cache))
+
+    # Merge, sort, cap — old rows are parsed here (tail only) just for the
+    # in-memory CSV/latest rebuild; the JSONL itself is append-only below.
+    old_items = []
+    for ln in old_lines:
+        try:
+            old_items.append(json.loads(ln))
+        except Exception:
+            pass
     all_items = ([] if args.force_refresh else old_items) + new_items
-    all_items_sorted = sorted(
-        all_items,
-        key=lambda x: (x.get("published_utc",""), x.get("ingested_utc","")),
-        reverse=True
+    # top-K selection (O(N log k)) — nlargest returns its k rows sorted
+    keep = heapq.nlargest(
+        JSONL_MAX_ROWS, all_items,
+        key=lambda x: (x.get("published_utc",""), x.get("ingested_utc",""))
     )
-    keep = all_items_sorted[:JSONL_MAX_ROWS]
     latest = keep[:LATEST_LIMIT]
 
     # ---------- Write outputs (docs/*) ----------
-    with open(JSONL_PATH, "w", encoding="utf-8") as f:
-        for obj in keep:
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-
-    with open(LATEST_PATH, "w", encoding="utf-8") as f:
-        json.dump(latest, f, ensure_ascii=False, indent=2)
-
-    with open(NEW_PATH, "w", encoding="utf-8") as f:
-        for obj in new_items:
-            f.write(json.dumps(obj, ensure_ascii=False) + "\n")
-
-    # CSV schema unchanged (keeps file stable)
-    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        w = csv.writer(f, quoting=csv.QUOTE_ALL, lineterminator="\n")
-        w.writerow(["published_utc","retrieved_date","source","title","url","id_key"])
+    # Batch rows in memory and hand the file one writelines/flush instead
+    # of a write() syscall per row.
+    # Compaction keeps the append-only archive bounded: once it overshoots
+    # the cap by 50%, rewrite it as the newest JSONL_MAX_ROWS rows.
+    if args.force_refresh or archive_rows + len(new_items) > JSONL_MAX_ROWS * 1.5:
+        with open(JSONL_PATH, "wb") as f:
+            f.writelines(_json_line(obj) for obj in keep)
+    elif new_items:
+        with open(JSONL_PATH, "ab") as f:
+            f.writelines(_json_line(obj) for obj in new_items)
+
+    # latest.json is machine-read only; compact output skips the indent pass
+    # and shrinks the file the site fetches on every page load.
+    with open(LATEST_PATH, "wb") as f:
+        f.write(_json_line(latest))
+
+    with open(NEW_PATH, "wb") as f:
+        f.writelines(_json_line(obj) for obj in new_items)
+
+    # CSV schema unchanged (keeps file stable). QUOTE_ALL with sanitized
+    # cells is simple enough to emit directly — one formatted line per
+    # row into a 1 MiB buffer, skipping csv.writer dispatch.
+    # Written to a temp file and os.replace'd so the CSV gets a fresh inode
+    # every run — that keeps dated hardlink snapshots of older runs intact.
+    _CSV_FIELDS = ("published_utc", "retrieved_date", "source", "title", "url", "id_key")
+    with open(CSV_PATH + ".tmp", "wb", buffering=1 << 20) as f:
+        f.write(b'"' + b'","'.join(k.encode() for k in _CSV_FIELDS) + b'"\n')
         for obj in keep:
-            w.writerow([
-                _csv_clean(obj.get("published_utc","")),
-                _csv_clean(obj.get("retrieved_date","")),
-                _csv_clean(obj.get("source","")),
-                _csv_clean(obj.get("title","")),
-                _csv_clean(obj.get("url","")),
-                _csv_clean(obj.get("id_key",""))
-            ])
+            cells = (_csv_clean(obj.get(k, "")).replace('"', '""') for k in _CSV_FIELDS)
+            f.write(('"' + '","'.join(cells) + '"\n').encode("utf-8"))
+    os.replace(CSV_PATH + ".tmp", CSV_PATH)
 
     # ---------- Append to data/processed/YYYY-MM-DD.jsonl (new items only) ----------
     processed_appended = 0
@@ -618,10 +1030,14 @@ def main():
         ts = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         snap_path = os.path.join(ARCHIVE_DIR, f"articles-{ts}.csv")
         try:
-            with open(CSV_PATH, "r", encoding="utf-8") as src, \
-                 open(snap_path, "w", newline="", encoding="utf-8") as dst:
-                for ln in src:
-                    dst.write(ln)
+            # snapshot is byte-identical to the fresh CSV — hardlink when the
+            # filesystem allows it (zero bytes copied), else zero-copy copy
+            if os.path.exists(snap_path):
+                os.remove(snap_path)
+            try:
+                os.link(CSV_PATH, snap_path)
+            except OSError:
+                shutil.copyfile(CSV_PATH, snap_path)
         except Exception as ex:
             snapshot_err = str(ex)
 
@@ -648,6 +1064,7 @@ def main():
         "stats": {
             "feeds_total": stats["feeds_total"],
             "feeds_error": stats["feeds_error"],
+            "feeds_not_modified": stats.get("feeds_not_modified", 0),
             "feeds_timeout": stats["feeds_timeout"],
             "feeds_http_error": stats["feeds_http_error"],
             "entries_seen": stats["entries_seen"],
@@ -669,8 +1086,8 @@ def main():
             "appended_new": processed_appended
         }
     }
-    with open(STATUS_PATH, "w", encoding="utf-8") as f:
-        json.dump(status, f, ensure_ascii=False, indent=2)
+    with open(STATUS_PATH, "wb") as f:
+        f.write(_json_pretty(status))
 
     print(json.dumps(status, indent=2))
 
@@ -14,14 +14,27 @@ def get_current_utc_date() -> str:
     """Return current UTC date as YYYY-MM-DD."""
     return datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
+def validate(date: str) -> list:
+    """Return a list of validation errors for the given date (empty = OK)."""
+    ai_final_dir = Path("data/ai_final")
+    drift_dir = Path("data/drift")
+
+    errors = []
+
+    if not any(ai_final_dir.glob(f"{date}*.jsonl")):
+        errors.append(f"No AI final output found for {date}")
+
+    if not any(drift_dir.glob(f"{date}_drift.json")):
+        errors.append(f"No drift file found for {date}")
+
+    return errors
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--date", help="YYYY-MM-DD (UTC). Leave empty to auto-detect.")
     args = parser.parse_args()
 
     processed_dir = Path("data/processed")
-    ai_final_dir = Path("data/ai_final")
-    drift_dir = Path("data/drift")
 
     # Step 1: Use provided date, else try latest file in processed_dir
     date = args.date
@@ -34,13 +47,7 @@ def main():
             date = get_current_utc_date()
             print(f"[validate] No processed files found, using current UTC date: {date}")
 
-    errors = []
-
-    if not any(ai_final_dir.glob(f"{date}*.jsonl")):
-        errors.append(f"No AI final output found for {date}")
-
-    if not any(drift_dir.glob(f"{date}_drift.json")):
-        errors.append(f"No drift file found for {date}")
+    errors = validate(date)
 
     if errors:
         for e in errors: